@@ -5,6 +5,9 @@ data, and runtime directories. It respects XDG environment variables on
 Linux/macOS and uses appropriate Windows equivalents on Windows platforms.
 
 All paths are created with restrictive permissions (0700) if they don't exist.
+Resolved paths are cached for the life of the process, so the environment is
+read only on the first call. The directory itself is checked on every call and
+re-created if it has been removed.
 
 IMPORTANT: This module MUST use only stdlib - NO external dependencies allowed.
 This is the foundation layer of the architecture.
@@ -13,6 +16,7 @@ This is the foundation layer of the architecture.
 import os
 import platform
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -34,20 +38,19 @@ def _is_wsl() -> bool:
     return "microsoft" in platform.uname().release.lower()
 
 
-def _get_env_path(var_name: str, default: Path | None = None) -> Path | None:
+def _get_env_path(var_name: str) -> Path | None:
     """Get path from environment variable with tilde expansion.
 
     Args:
         var_name: Name of the environment variable to read.
-        default: Default path to return if variable not set or empty.
 
     Returns:
-        Path from environment variable (expanded), default, or None.
+        Path from environment variable (expanded), or None if not set or empty.
     """
     value = os.environ.get(var_name)
     if value:
         return Path(value).expanduser()
-    return default
+    return None
 
 
 def _ensure_directory(path: Path, mode: int = 0o700) -> Path:
@@ -66,11 +69,13 @@ def _ensure_directory(path: Path, mode: int = 0o700) -> Path:
     Raises:
         OSError: If directory cannot be created or accessed.
     """
-    path.mkdir(parents=True, exist_ok=True, mode=mode)
+    # One stat covers the common case where the directory already exists
+    if not os.path.isdir(path):
+        os.makedirs(path, mode=mode, exist_ok=True)
 
-    # Enforce permissions on Unix (mkdir mode can be affected by umask)
+    # Enforce permissions on Unix (makedirs mode can be affected by umask)
     if not _is_windows():
-        path.chmod(mode)
+        os.chmod(path, mode)
 
     return path
 
@@ -105,19 +110,15 @@ def _get_unix_runtime_base() -> Path:
     return Path.home() / ".local" / "run"
 
 
-def get_config_dir() -> Path:
-    """Get the jot configuration directory.
-
-    Returns XDG_CONFIG_HOME/jot on Linux/macOS, %APPDATA%/jot on Windows.
-    Creates directory with 0700 permissions if it doesn't exist.
-    Respects XDG_CONFIG_HOME environment variable override.
+@lru_cache(maxsize=1)
+def _resolve_config_dir() -> Path:
+    """Resolve (and cache) the jot configuration directory path.
 
     Returns:
-        Path: Absolute path to config directory.
+        Path: Config directory path, not yet created.
 
     Raises:
-        OSError: If directory cannot be created or accessed, or if required
-                 Windows environment variables are not set.
+        OSError: If required Windows environment variables are not set.
     """
     if _is_windows():
         # Windows: %APPDATA%/jot
@@ -127,29 +128,40 @@ def get_config_dir() -> Path:
         config_dir = Path(appdata) / "jot"
     else:
         # Linux/macOS: XDG_CONFIG_HOME/jot or ~/.config/jot
-        default = Path.home() / ".config"
-        config_home = _get_env_path("XDG_CONFIG_HOME", default)
-        if config_home is None:
-            config_home = default
+        config_home = _get_env_path("XDG_CONFIG_HOME") or Path.home() / ".config"
         config_dir = config_home / "jot"
 
-    return _ensure_directory(config_dir)
+    return config_dir
 
 
-def get_data_dir() -> Path:
-    """Get the jot data directory.
+def get_config_dir() -> Path:
+    """Get the jot configuration directory.
 
-    Returns XDG_DATA_HOME/jot on Linux/macOS, %LOCALAPPDATA%/jot on Windows.
-    Creates directory with 0700 permissions if it doesn't exist.
-    Respects XDG_DATA_HOME environment variable override.
+    Returns XDG_CONFIG_HOME/jot on Linux/macOS, %APPDATA%/jot on Windows.
+    Creates directory with 0700 permissions if it doesn't exist. The path is
+    resolved once and cached; the directory is ensured on every call.
+    Respects XDG_CONFIG_HOME environment variable override.
 
     Returns:
-        Path: Absolute path to data directory.
+        Path: Absolute path to config directory.
 
     Raises:
         OSError: If directory cannot be created or accessed, or if required
                  Windows environment variables are not set.
     """
+    return _ensure_directory(_resolve_config_dir())
+
+
+@lru_cache(maxsize=1)
+def _resolve_data_dir() -> Path:
+    """Resolve (and cache) the jot data directory path.
+
+    Returns:
+        Path: Data directory path, not yet created.
+
+    Raises:
+        OSError: If required Windows environment variables are not set.
+    """
     if _is_windows():
         # Windows: %LOCALAPPDATA%/jot
         local_appdata = os.environ.get("LOCALAPPDATA")
@@ -158,30 +170,40 @@ def get_data_dir() -> Path:
         data_dir = Path(local_appdata) / "jot"
     else:
         # Linux/macOS: XDG_DATA_HOME/jot or ~/.local/share/jot
-        default = Path.home() / ".local" / "share"
-        data_home = _get_env_path("XDG_DATA_HOME", default)
-        if data_home is None:
-            data_home = default
+        data_home = _get_env_path("XDG_DATA_HOME") or Path.home() / ".local" / "share"
         data_dir = data_home / "jot"
 
-    return _ensure_directory(data_dir)
+    return data_dir
 
 
-def get_runtime_dir() -> Path:
-    """Get the jot runtime directory.
+def get_data_dir() -> Path:
+    """Get the jot data directory.
 
-    Returns XDG_RUNTIME_DIR/jot on Linux/macOS with fallback.
-    Falls back to /run/user/<uid>, TMPDIR, or ~/.local/run on Unix.
-    On Windows, returns %TEMP%/jot.
-    Creates directory with 0700 permissions if it doesn't exist.
+    Returns XDG_DATA_HOME/jot on Linux/macOS, %LOCALAPPDATA%/jot on Windows.
+    Creates directory with 0700 permissions if it doesn't exist. The path is
+    resolved once and cached; the directory is ensured on every call.
+    Respects XDG_DATA_HOME environment variable override.
 
     Returns:
-        Path: Absolute path to runtime directory.
+        Path: Absolute path to data directory.
 
     Raises:
         OSError: If directory cannot be created or accessed, or if required
                  Windows environment variables are not set.
     """
+    return _ensure_directory(_resolve_data_dir())
+
+
+@lru_cache(maxsize=1)
+def _resolve_runtime_dir() -> Path:
+    """Resolve (and cache) the jot runtime directory path.
+
+    Returns:
+        Path: Runtime directory path, not yet created.
+
+    Raises:
+        OSError: If required Windows environment variables are not set.
+    """
     if _is_windows():
         # Windows: %TEMP%/jot
         temp = os.environ.get("TEMP")
@@ -193,4 +215,24 @@ def get_runtime_dir() -> Path:
         runtime_base = _get_unix_runtime_base()
         runtime_dir = runtime_base / "jot"
 
-    return _ensure_directory(runtime_dir)
+    return runtime_dir
+
+
+def get_runtime_dir() -> Path:
+    """Get the jot runtime directory.
+
+    Returns XDG_RUNTIME_DIR/jot on Linux/macOS with fallback.
+    Falls back to /run/user/<uid>, TMPDIR, or ~/.local/run on Unix.
+    On Windows, returns %TEMP%/jot.
+    Creates directory with 0700 permissions if it doesn't exist. The path is
+    resolved once and cached; the directory is ensured on every call, so it is
+    re-created if the runtime base is cleaned up while the monitor is running.
+
+    Returns:
+        Path: Absolute path to runtime directory.
+
+    Raises:
+        OSError: If directory cannot be created or accessed, or if required
+                 Windows environment variables are not set.
+    """
+    return _ensure_directory(_resolve_runtime_dir())
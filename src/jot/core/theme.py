@@ -6,6 +6,7 @@ for consistent design language between Rich (CLI) and Textual (monitor) interfac
 
 import logging
 import os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from rich.console import Console
@@ -207,6 +208,20 @@ def get_textual_style_for_state(state: StateInput) -> dict[str, str | bool]:
             f"Valid states: {list(_STATE_COLOR_MAP.keys())}"
         )
 
+    # Copy so callers can't mutate the cached style
+    return dict(_build_textual_style(state_str))
+
+
+@lru_cache(maxsize=32)
+def _build_textual_style(state_str: str) -> dict[str, str | bool]:
+    """Build (and cache) the Textual style dictionary for a state string.
+
+    Args:
+        state_str: State string (e.g., "active", "completed")
+
+    Returns:
+        Dictionary with Textual style attributes. Shared between calls, do not mutate.
+    """
     color = _STATE_COLOR_MAP.get(state_str, TaskColors.MUTED)
     style_dict: dict[str, str | bool] = {"foreground": color}
 
@@ -13,6 +13,19 @@ from jot.core.task import Task, TaskEvent, TaskState
 from jot.db.connection import get_connection
 from jot.db.exceptions import DatabaseError
 
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks (
+        id, description, state, created_at, updated_at,
+        completed_at, cancelled_at, cancel_reason,
+        deferred_at, defer_reason, deferred_until
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CREATED_EVENT_SQL = """
+    INSERT INTO task_events (task_id, event_type, timestamp)
+    VALUES (?, ?, ?)
+"""
+
 
 class TaskRepository:
     """Repository for task persistence operations.
@@ -31,6 +44,20 @@ class TaskRepository:
         Args:
             task: Task model to create
 
+        Raises:
+            DatabaseError: If task creation fails
+        """
+        self.create_tasks([task])
+
+    def create_tasks(self, tasks: list[Task]) -> None:
+        """Create multiple tasks with their CREATED events atomically.
+
+        Uses a single connection and transaction for the whole batch, so
+        either every task (and its event) is created or none are.
+
+        Args:
+            tasks: Task models to create
+
         Raises:
             DatabaseError: If task creation fails
         """
@@ -38,44 +65,20 @@ class TaskRepository:
         try:
             cursor = conn.cursor()
 
-            # Insert task
-            cursor.execute(
-                """
-                INSERT INTO tasks (
-                    id, description, state, created_at, updated_at,
-                    completed_at, cancelled_at, cancel_reason,
-                    deferred_at, defer_reason, deferred_until
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task.id,
-                    task.description,
-                    task.state.value,
-                    task.created_at.isoformat(),
-                    task.updated_at.isoformat(),
-                    task.completed_at.isoformat() if task.completed_at else None,
-                    task.cancelled_at.isoformat() if task.cancelled_at else None,
-                    task.cancel_reason,
-                    task.deferred_at.isoformat() if task.deferred_at else None,
-                    task.defer_reason,
-                    task.deferred_until.isoformat() if task.deferred_until else None,
-                ),
-            )
+            # Insert tasks
+            cursor.executemany(_INSERT_TASK_SQL, [self._task_to_row(task) for task in tasks])
 
-            # Create CREATED event
-            cursor.execute(
-                """
-                INSERT INTO task_events (task_id, event_type, timestamp)
-                VALUES (?, ?, ?)
-                """,
-                (task.id, "CREATED", task.created_at.isoformat()),
+            # Create CREATED events
+            cursor.executemany(
+                _INSERT_CREATED_EVENT_SQL,
+                [(task.id, "CREATED", task.created_at.isoformat()) for task in tasks],
             )
 
             conn.commit()
 
         except sqlite3.Error as e:
             conn.rollback()
-            raise DatabaseError(f"Failed to create task: {e}") from e
+            raise DatabaseError(f"Failed to create tasks: {e}") from e
         finally:
             conn.close()
 
@@ -296,6 +299,29 @@ class TaskRepository:
         finally:
             conn.close()
 
+    def _task_to_row(self, task: Task) -> tuple[str | None, ...]:
+        """Convert Task model to a parameter tuple for _INSERT_TASK_SQL.
+
+        Args:
+            task: Task domain model
+
+        Returns:
+            Column values in _INSERT_TASK_SQL order
+        """
+        return (
+            task.id,
+            task.description,
+            task.state.value,
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+            task.completed_at.isoformat() if task.completed_at else None,
+            task.cancelled_at.isoformat() if task.cancelled_at else None,
+            task.cancel_reason,
+            task.deferred_at.isoformat() if task.deferred_at else None,
+            task.defer_reason,
+            task.deferred_until.isoformat() if task.deferred_until else None,
+        )
+
     def _row_to_task(self, row: sqlite3.Row) -> Task:
         """Convert SQLite row to Task model.
 
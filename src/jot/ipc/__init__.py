@@ -6,11 +6,15 @@ The ipc package can ONLY import from core.exceptions and config.paths.
 It MUST NOT import from commands/ or monitor/.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from jot.core.exceptions import IPCError
 from jot.ipc.client import notify_monitor
 from jot.ipc.events import IPCEvent
 from jot.ipc.protocol import deserialize_message, serialize_message
-from jot.ipc.server import IPCServer
+
+if TYPE_CHECKING:
+    from jot.ipc.server import IPCServer
 
 __all__ = [
     "IPCEvent",
@@ -20,3 +24,12 @@ __all__ = [
     "notify_monitor",
     "IPCServer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import IPCServer on first access so CLI commands only load the client side."""
+    if name == "IPCServer":
+        from jot.ipc.server import IPCServer
+
+        return IPCServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
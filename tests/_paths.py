@@ -0,0 +1,11 @@
+"""Repository paths shared by the test suite, computed once at import."""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+JOT_PACKAGE_DIR = SRC_DIR / "jot"
+CONFIG_PACKAGE_DIR = JOT_PACKAGE_DIR / "config"
+PATHS_MODULE = CONFIG_PACKAGE_DIR / "paths.py"
+TESTS_DIR = PROJECT_ROOT / "tests"
+PYPROJECT_TOML = PROJECT_ROOT / "pyproject.toml"
@@ -1,14 +1,65 @@
 """Shared pytest fixtures."""
 
+import importlib
+from collections.abc import Iterator
 from pathlib import Path
+from types import ModuleType
 
 import pytest
+import typer
+
+from jot.config.paths import _resolve_config_dir, _resolve_data_dir, _resolve_runtime_dir
+from tests._paths import PROJECT_ROOT
+
+# Opt-in markers mapped to the command-line flag that enables them
+_OPT_IN_MARKERS = {
+    "memprofile": "--memprofile",
+    "perf": "--run-perf",
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register opt-in flags for expensive profiling tests."""
+    parser.addoption(
+        "--memprofile",
+        action="store_true",
+        default=False,
+        help="run tracemalloc-based memory profiling tests",
+    )
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=False,
+        help="run latency benchmark tests",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip opt-in marked tests unless their command-line flag is given."""
+    for marker, option in _OPT_IN_MARKERS.items():
+        if config.getoption(option):
+            continue
+        skip_marker = pytest.mark.skip(reason=f"need {option} option to run")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip_marker)
+
+
+@pytest.fixture(autouse=True)
+def clear_path_caches() -> Iterator[None]:
+    """Reset the cached XDG path resolvers so each test resolves from its own environment."""
+    resolvers = (_resolve_config_dir, _resolve_data_dir, _resolve_runtime_dir)
+    for resolver in resolvers:
+        resolver.cache_clear()
+    yield
+    for resolver in resolvers:
+        resolver.cache_clear()
 
 
 @pytest.fixture
 def project_root() -> Path:
     """Return the project root directory."""
-    return Path(__file__).parent.parent
+    return PROJECT_ROOT
 
 
 @pytest.fixture
@@ -21,3 +72,20 @@ def src_dir(project_root: Path) -> Path:
 def jot_package_dir(src_dir: Path) -> Path:
     """Return the jot package directory."""
     return src_dir / "jot"
+
+
+@pytest.fixture(scope="session")
+def jot_subpackages() -> dict[str, ModuleType]:
+    """Return each jot subpackage, imported once per session."""
+    return {
+        name: importlib.import_module(f"jot.{name}")
+        for name in ("commands", "config", "core", "db", "ipc", "monitor")
+    }
+
+
+@pytest.fixture(scope="session")
+def cli_app() -> typer.Typer:
+    """Return the jot Typer application, imported once per session."""
+    from jot.cli import app
+
+    return app
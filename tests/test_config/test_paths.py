@@ -78,16 +78,7 @@ class TestEnvPathHelper:
         assert result == Path.home() / "custom"
 
     def test_get_env_path_when_not_set(self, monkeypatch):
-        """Test _get_env_path returns default when variable not set."""
-        monkeypatch.delenv("TEST_VAR", raising=False)
-        default = Path("/default/path")
-
-        result = _get_env_path("TEST_VAR", default)
-
-        assert result == default
-
-    def test_get_env_path_none_default(self, monkeypatch):
-        """Test _get_env_path returns None when no default provided."""
+        """Test _get_env_path returns None when variable not set."""
         monkeypatch.delenv("TEST_VAR", raising=False)
 
         result = _get_env_path("TEST_VAR")
@@ -166,7 +157,7 @@ class TestEnsureDirectory:
         def raise_permission_error(*_args, **_kwargs):  # type: ignore[no-untyped-def]
             raise PermissionError("no write permission")
 
-        monkeypatch.setattr(Path, "mkdir", raise_permission_error)
+        monkeypatch.setattr("jot.config.paths.os.makedirs", raise_permission_error)
 
         with pytest.raises(PermissionError, match="no write permission"):
             _ensure_directory(target_dir)
@@ -180,7 +171,7 @@ class TestEnsureDirectory:
         def raise_permission_error(*_args, **_kwargs):  # type: ignore[no-untyped-def]
             raise PermissionError("chmod denied")
 
-        monkeypatch.setattr(Path, "chmod", raise_permission_error)
+        monkeypatch.setattr("jot.config.paths.os.chmod", raise_permission_error)
 
         with pytest.raises(PermissionError, match="chmod denied"):
             _ensure_directory(target_dir)
@@ -556,6 +547,29 @@ class TestEdgeCases:
         assert dir1 == dir2 == dir3
         assert dir1.exists()
 
+    def test_repeated_calls_use_cached_path(self, clean_env, mock_home, monkeypatch):
+        """Test calls after the first reuse the cached path without reading the environment."""
+        monkeypatch.setattr("sys.platform", "linux")
+        config_dir = get_config_dir()
+
+        def fail_get_env_path(*_args, **_kwargs):  # type: ignore[no-untyped-def]
+            raise AssertionError("path should not be re-resolved")
+
+        monkeypatch.setattr("jot.config.paths._get_env_path", fail_get_env_path)
+
+        assert get_config_dir() == config_dir
+
+    def test_removed_runtime_dir_is_recreated(self, clean_env, mock_home, monkeypatch, tmp_path):
+        """Test a runtime directory cleaned up after the first call is re-created."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "runtime"))
+        monkeypatch.setattr("sys.platform", "linux")
+
+        runtime_dir = get_runtime_dir()
+        runtime_dir.rmdir()
+
+        assert get_runtime_dir() == runtime_dir
+        assert runtime_dir.is_dir()
+
     def test_empty_string_env_var_uses_default(self, clean_env, mock_home, monkeypatch):
         """Test empty string environment variable falls back to default."""
         monkeypatch.setenv("XDG_CONFIG_HOME", "")
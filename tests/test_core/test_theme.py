@@ -1,5 +1,6 @@
 """Test suite for core.theme module."""
 
+import logging
 import os
 from unittest.mock import MagicMock, patch
 
@@ -406,6 +407,15 @@ class TestTextualCompatibility:
         style_dict = get_textual_style_for_state("unknown")
         assert style_dict["foreground"] == TaskColors.MUTED
 
+    def test_get_textual_style_for_state_unknown_warns_on_every_call(self, caplog):
+        """Test the unknown-state warning is logged on each call, not once per cached state."""
+        with caplog.at_level(logging.WARNING, logger="jot.core.theme"):
+            get_textual_style_for_state("bogus")
+            get_textual_style_for_state("bogus")
+
+        warnings = [r for r in caplog.records if "Unknown task state 'bogus'" in r.message]
+        assert len(warnings) == 2
+
     def test_get_textual_style_for_state_with_textual_style_object(self):
         """Test get_textual_style_for_state works with actual Textual Style objects."""
         try:
@@ -430,6 +440,14 @@ class TestTextualCompatibility:
         assert style_dict["foreground"] == TaskColors.COMPLETED
         assert style_dict["strike"] is True
 
+    def test_get_textual_style_for_state_returns_independent_copies(self):
+        """Test mutating a returned style dict does not affect later calls (cached lookup)."""
+        style_dict = get_textual_style_for_state("active")
+        style_dict["foreground"] = "magenta"
+
+        assert get_textual_style_for_state("active")["foreground"] == TaskColors.ACTIVE
+        assert get_textual_style_for_state(TaskState.ACTIVE)["foreground"] == TaskColors.ACTIVE
+
     def test_get_emoji_with_taskstate_enum(self):
         """Test get_emoji accepts TaskState enum."""
         assert get_emoji(TaskState.ACTIVE) == TaskEmoji.ACTIVE
@@ -1,9 +1,13 @@
 """Shared pytest fixtures for database tests."""
 
+import sqlite3
 from pathlib import Path
 
 import pytest
 
+from jot.db.connection import get_connection
+from jot.db.migrations import migrate_schema
+
 
 @pytest.fixture
 def db_path(tmp_path: Path) -> Path:
@@ -21,9 +25,6 @@ def mock_data_dir(monkeypatch, tmp_path: Path):
 @pytest.fixture
 def clean_db(mock_data_dir, db_path: Path):
     """Provide a clean database connection with schema migrated."""
-    from jot.db.connection import get_connection
-    from jot.db.migrations import migrate_schema
-
     # Remove existing database if present
     if db_path.exists():
         db_path.unlink()
@@ -46,23 +47,27 @@ def clean_db(mock_data_dir, db_path: Path):
 
 
 @pytest.fixture
-def temp_db(mock_data_dir, db_path: Path):
+def temp_db(mock_data_dir, db_path: Path, monkeypatch):
     """Provide a temporary database with schema for repository tests.
 
     This fixture sets up a clean database with the schema migrated,
     allowing repository tests to use get_connection() directly.
+    Repository connections skip fsync (synchronous=OFF) since test data is throwaway.
     """
-    from jot.db.connection import get_connection
-    from jot.db.migrations import migrate_schema
+
+    def get_unsynced_connection() -> sqlite3.Connection:
+        conn = get_connection()
+        conn.execute("PRAGMA synchronous=OFF")
+        return conn
+
+    monkeypatch.setattr("jot.db.repository.get_connection", get_unsynced_connection)
 
     # Remove existing database if present
     if db_path.exists():
         db_path.unlink()
 
-    # Initialize schema
-    conn = get_connection()
-    migrate_schema(conn)
-    conn.close()
+    # Initialize schema (get_connection migrates on open)
+    get_connection().close()
 
     yield None
 
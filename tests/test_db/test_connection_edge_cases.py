@@ -146,3 +146,15 @@ class TestConnectionEdgeCases:
         assert sync_mode == 1  # NORMAL
 
         conn.close()
+
+    def test_temp_db_disables_synchronous_mode(self, temp_db):
+        """Test that the temp_db fixture relaxes repository connections to OFF."""
+        from jot.db import repository
+
+        conn = repository.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA synchronous")
+        assert cursor.fetchone()[0] == 0  # OFF
+
+        conn.close()
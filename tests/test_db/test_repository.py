@@ -8,6 +8,7 @@ import pytest
 
 from jot.core.exceptions import TaskNotFoundError
 from jot.core.task import Task, TaskEvent, TaskState
+from jot.db.exceptions import DatabaseError
 from jot.db.repository import EventRepository, TaskRepository
 
 
@@ -43,6 +44,63 @@ class TestTaskRepository:
         assert events[0].event_type == "CREATED"
         assert events[0].task_id == task_id
 
+    def test_create_tasks_creates_all_tasks_and_events(self, temp_db):
+        """Test create_tasks() creates every task and its CREATED event."""
+        repo = TaskRepository()
+        event_repo = EventRepository()
+
+        now = datetime.now(UTC)
+        tasks = [
+            Task(
+                id=str(uuid.uuid4()),
+                description=f"Bulk task {i}",
+                state=TaskState.COMPLETED,
+                created_at=now,
+                updated_at=now,
+                completed_at=now,
+            )
+            for i in range(3)
+        ]
+
+        repo.create_tasks(tasks)
+
+        for task in tasks:
+            retrieved = repo.get_task_by_id(task.id)
+            assert retrieved.description == task.description
+            assert retrieved.state == TaskState.COMPLETED
+            assert retrieved.completed_at == now
+
+            events = event_repo.get_events_for_task(task.id)
+            assert len(events) == 1
+            assert events[0].event_type == "CREATED"
+
+    def test_create_tasks_is_atomic(self, temp_db):
+        """Test create_tasks() creates nothing if any row in the batch fails."""
+        repo = TaskRepository()
+
+        now = datetime.now(UTC)
+        task = Task(
+            id=str(uuid.uuid4()),
+            description="Duplicated task",
+            state=TaskState.ACTIVE,
+            created_at=now,
+            updated_at=now,
+        )
+        first = Task(
+            id=str(uuid.uuid4()),
+            description="First task",
+            state=TaskState.ACTIVE,
+            created_at=now,
+            updated_at=now,
+        )
+
+        # Duplicate primary key in the same batch
+        with pytest.raises(DatabaseError):
+            repo.create_tasks([first, task, task])
+
+        with pytest.raises(TaskNotFoundError):
+            repo.get_task_by_id(first.id)
+
     def test_get_task_by_id_returns_task(self, temp_db):
         """Test get_task_by_id() returns the correct task."""
         repo = TaskRepository()
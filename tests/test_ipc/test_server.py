@@ -808,11 +808,15 @@ class TestIPCServerEdgeCases:
         if IPCServer is None:
             pytest.skip("IPCServer not yet implemented")
 
-        callback = AsyncMock()
-        socket_path = tmp_path / "monitor.sock"
+        calls: list[tuple[IPCEvent, str]] = []
 
-        server = IPCServer(callback=callback, socket_path=socket_path)
+        async def callback(event: IPCEvent, task_id: str) -> None:
+            calls.append((event, task_id))
+
+        server = IPCServer(callback=callback, socket_path=tmp_path / "monitor.sock")
         await server.start()
+        # Pre-connected in-kernel pair, fed straight to the connection handler
+        server_sock, client_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
 
         try:
             from jot.ipc.protocol import serialize_message
@@ -825,15 +829,14 @@ class TestIPCServerEdgeCases:
             ]
             combined = "".join(messages)
 
-            client_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            client_sock.settimeout(1.0)
-            client_sock.connect(str(socket_path))
             client_sock.sendall(combined.encode("utf-8"))
-            client_sock.close()
+            client_sock.shutdown(socket.SHUT_WR)
 
-            await asyncio.sleep(0.2)
+            # Handler reads until EOF, so both messages are processed when it returns
+            await asyncio.wait_for(server._handle_connection(server_sock), timeout=1.0)
 
             # Should process both valid messages, skip empty line
-            assert callback.call_count == 2
+            assert calls == [(IPCEvent.TASK_CREATED, "task-1"), (IPCEvent.TASK_COMPLETED, "task-2")]
         finally:
+            client_sock.close()
             await server.stop()
@@ -1,4 +1,26 @@
 """Shared pytest fixtures for monitor tests."""
 
+import pytest
+
+from jot.db.repository import TaskRepository
+from jot.monitor.app import MonitorApp
+
 # Import database fixtures from test_db
 from tests.test_db.conftest import db_path, mock_data_dir, temp_db  # noqa: F401
+from tests.test_monitor.helpers import compose_app
+
+
+@pytest.fixture
+def repo(temp_db) -> TaskRepository:  # noqa: F811
+    """Provide a TaskRepository bound to the temporary test database."""
+    return TaskRepository()
+
+
+@pytest.fixture
+def app() -> MonitorApp:
+    """Provide a fresh MonitorApp with its task widget already composed.
+
+    Built per test rather than shared: the app carries title, widget styles
+    and IPC server state that would otherwise leak between tests.
+    """
+    return compose_app()
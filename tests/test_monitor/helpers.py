@@ -0,0 +1,65 @@
+"""Helper utilities for monitor tests."""
+
+import itertools
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from jot.core.task import Task, TaskState
+from jot.monitor.app import MonitorApp
+
+# Fixed timestamp and counter-based IDs keep task construction deterministic
+FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+_task_ids = itertools.count()
+
+
+def make_task(description: str, state: TaskState = TaskState.ACTIVE, **kwargs: Any) -> Task:
+    """Build a Task with a unique deterministic ID and fixed timestamps."""
+    return Task(
+        id=f"task-{next(_task_ids):08d}",
+        description=description,
+        state=state,
+        created_at=FIXED_TS,
+        updated_at=FIXED_TS,
+        **kwargs,
+    )
+
+
+def compose_app() -> MonitorApp:
+    """Create a MonitorApp and compose its task widget without running the app."""
+    monitor_app = MonitorApp()
+    monitor_app._task_widget = next(monitor_app.compose(), None)
+    return monitor_app
+
+
+class FakeIPCServer:
+    """Lightweight stand-in for IPCServer that records start/stop calls.
+
+    Set ``start_error`` or ``stop_error`` to make the corresponding call raise.
+    """
+
+    start_error: Exception | None = None
+    stop_error: Exception | None = None
+
+    def __init__(self, callback: Any, socket_path: Path | None = None) -> None:
+        self.callback = callback
+        self.socket_path = socket_path
+        self.started = 0
+        self.stopped = 0
+
+    async def start(self) -> None:
+        self.started += 1
+        if self.start_error is not None:
+            raise self.start_error
+
+    async def stop(self) -> None:
+        self.stopped += 1
+        if self.stop_error is not None:
+            raise self.stop_error
+
+
+class FailingTaskRepository:
+    """Stand-in for TaskRepository whose active-task query always fails."""
+
+    def get_active_task(self) -> None:
+        raise Exception("Database error")
@@ -5,370 +5,212 @@ CLI command → IPC client → IPC server → MonitorApp callback → Display up
 """
 
 import asyncio
-import contextlib
 import socket
-import uuid
-from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 
-from jot.core.task import Task, TaskState
-from jot.db.repository import TaskRepository
+from jot.core.task import TaskState
 from jot.ipc.client import notify_monitor
 from jot.ipc.events import IPCEvent
 from jot.monitor.app import MonitorApp
+from tests.test_monitor.helpers import FIXED_TS, compose_app, make_task
 
 # Check if Unix domain sockets are available
 _HAS_AF_UNIX = hasattr(socket, "AF_UNIX")
 
-# IPC propagation delay - time to wait for IPC message to propagate and be processed
-# Set to 200ms (2x the 100ms AC requirement) to ensure reliable test execution
-IPC_PROPAGATION_DELAY_S = 0.2
+# Upper bound on waiting for the monitor to process an IPC message. Tests wake as
+# soon as the handler finishes; the timeout only turns a lost message into a failure.
+IPC_EVENT_TIMEOUT_S = 2.0
 
 
-@pytest.mark.skipif(not _HAS_AF_UNIX, reason="Unix domain sockets not available on this platform")
-@pytest.mark.asyncio
-class TestRealTimeMonitorUpdatesE2E:
-    """End-to-end tests for real-time monitor updates."""
-
-    async def test_cli_add_command_updates_monitor_display(self, temp_db, tmp_path: Path) -> None:
-        """Test that CLI 'add' command triggers monitor display update via IPC."""
-        # Arrange: Set up monitor app with IPC server
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
-
-            # Start IPC server
-            await app.on_mount()
-
-            try:
-                # Initially no active task
-                assert app._active_task is None
-                assert "No active task" in str(app._task_widget.content)
-
-                # Act: Create task via repository and send IPC notification
-                repo = TaskRepository()
-                task = Task(
-                    id=str(uuid.uuid4()),
-                    description="E2E test task",
-                    state=TaskState.ACTIVE,
-                    created_at=datetime.now(UTC),
-                    updated_at=datetime.now(UTC),
-                )
-                repo.create_task(task)
-
-                # Send IPC notification (simulating CLI command)
-                notify_monitor(IPCEvent.TASK_CREATED, task.id)
-
-                # Give IPC server time to process message
-                await asyncio.sleep(IPC_PROPAGATION_DELAY_S)
-
-                # Assert: Monitor should have updated display
-                assert app._active_task is not None
-                assert app._active_task.description == "E2E test task"
-                widget_content = str(app._task_widget.content)
-                assert "E2E test task" in widget_content
-                assert app.title == "jot - E2E test task"
-
-            finally:
-                await app.on_unmount()
-
-    async def test_cli_done_command_updates_monitor_display(self, temp_db, tmp_path: Path) -> None:
-        """Test that CLI 'done' command triggers monitor display update via IPC."""
-        # Arrange: Create active task and set up monitor
-        repo = TaskRepository()
-        task = Task(
-            id=str(uuid.uuid4()),
-            description="Task to complete",
-            state=TaskState.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
-        repo.create_task(task)
-
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
-
-            # Start IPC server and load initial task
-            await app.on_mount()
+@pytest_asyncio.fixture(loop_scope="module")
+async def app(temp_db, tmp_path: Path, monkeypatch):
+    """Provide a composed MonitorApp whose IPC socket lives in tmp_path.
 
-            try:
-                # Verify initial state shows task
-                assert app._active_task is not None
-                assert app._active_task.description == "Task to complete"
+    Tests arrange their data and then call ``on_mount()`` themselves, since
+    the initial database load is part of what they check. The app is
+    unmounted (stopping its IPC server) at teardown. Use ``wait_for_ipc``
+    to block until the monitor has handled a notification.
+    """
+    monkeypatch.setattr("jot.ipc.server.get_runtime_dir", lambda: tmp_path)
+    monkeypatch.setattr("jot.ipc.client.get_runtime_dir", lambda: tmp_path)
 
-                # Act: Complete task and send IPC notification
-                task.state = TaskState.COMPLETED
-                task.completed_at = datetime.now(UTC)
-                repo.update_task(task)
+    monitor_app = compose_app()
 
-                notify_monitor(IPCEvent.TASK_COMPLETED, task.id)
+    # Signal each processed IPC message; on_mount hands this wrapper to the server
+    processed = asyncio.Event()
+    handle_ipc_event = monitor_app._handle_ipc_event
 
-                # Give IPC server time to process
-                await asyncio.sleep(0.2)
+    async def handle_ipc_event_and_signal(event: IPCEvent, task_id: str) -> None:
+        await handle_ipc_event(event, task_id)
+        processed.set()
 
-                # Assert: Monitor should show no active task
-                assert app._active_task is None
-                widget_content = str(app._task_widget.content)
-                assert "No active task" in widget_content
-                assert app.title == "jot - No active task"
+    monitor_app._handle_ipc_event = handle_ipc_event_and_signal
+    monitor_app._ipc_processed = processed
 
-            finally:
-                await app.on_unmount()
+    yield monitor_app
 
-    async def test_cli_cancel_command_updates_monitor_display(
-        self, temp_db, tmp_path: Path
-    ) -> None:
-        """Test that CLI 'cancel' command triggers monitor display update via IPC."""
-        # Arrange: Create active task and set up monitor
-        repo = TaskRepository()
-        task = Task(
-            id=str(uuid.uuid4()),
-            description="Task to cancel",
-            state=TaskState.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
-        repo.create_task(task)
+    await monitor_app.on_unmount()
 
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
 
-            await app.on_mount()
+async def wait_for_ipc(app: MonitorApp) -> None:
+    """Wait until the monitor has processed the next IPC message, then reset the signal."""
+    await asyncio.wait_for(app._ipc_processed.wait(), timeout=IPC_EVENT_TIMEOUT_S)
+    app._ipc_processed.clear()
 
-            try:
-                # Verify initial state
-                assert app._active_task is not None
 
-                # Act: Cancel task and send IPC notification
-                task.state = TaskState.CANCELLED
-                task.cancelled_at = datetime.now(UTC)
-                repo.update_task(task)
-
-                notify_monitor(IPCEvent.TASK_CANCELLED, task.id)
+@pytest.mark.skipif(not _HAS_AF_UNIX, reason="Unix domain sockets not available on this platform")
+@pytest.mark.asyncio(loop_scope="module")
+class TestRealTimeMonitorUpdatesE2E:
+    """End-to-end tests for real-time monitor updates."""
 
-                await asyncio.sleep(0.2)
+    async def test_cli_add_command_updates_monitor_display(self, app, repo) -> None:
+        """Test that CLI 'add' command triggers monitor display update via IPC."""
+        # Arrange: Start IPC server
+        await app.on_mount()
 
-                # Assert: Monitor should show no active task
-                assert app._active_task is None
-                widget_content = str(app._task_widget.content)
-                assert "No active task" in widget_content
+        # Initially no active task
+        assert app._active_task is None
+        assert "No active task" in app._task_widget.content
 
-            finally:
-                await app.on_unmount()
+        # Act: Create task via repository and send IPC notification
+        task = make_task("E2E test task")
+        repo.create_task(task)
 
-    async def test_cli_defer_command_updates_monitor_display(self, temp_db, tmp_path: Path) -> None:
-        """Test that CLI 'defer' command triggers monitor display update via IPC."""
+        # Send IPC notification (simulating CLI command)
+        notify_monitor(IPCEvent.TASK_CREATED, task.id)
+
+        # Wait for IPC server to process message
+        await wait_for_ipc(app)
+
+        # Assert: Monitor should have updated display
+        assert app._active_task is not None
+        assert app._active_task.description == "E2E test task"
+        assert "E2E test task" in app._task_widget.content
+        assert app.title == "jot - E2E test task"
+
+    @pytest.mark.parametrize(
+        ("event", "new_state", "timestamp_field"),
+        [
+            (IPCEvent.TASK_COMPLETED, TaskState.COMPLETED, "completed_at"),
+            (IPCEvent.TASK_CANCELLED, TaskState.CANCELLED, "cancelled_at"),
+            (IPCEvent.TASK_DEFERRED, TaskState.DEFERRED, "deferred_at"),
+        ],
+    )
+    async def test_cli_state_change_command_updates_monitor_display(
+        self, app, repo, event, new_state, timestamp_field
+    ) -> None:
+        """Test that CLI 'done', 'cancel' and 'defer' commands clear the monitor via IPC."""
         # Arrange: Create active task and set up monitor
-        repo = TaskRepository()
-        task = Task(
-            id=str(uuid.uuid4()),
-            description="Task to defer",
-            state=TaskState.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
+        task = make_task("Task to change state")
         repo.create_task(task)
 
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
-
-            await app.on_mount()
-
-            try:
-                # Verify initial state
-                assert app._active_task is not None
+        # Start IPC server and load initial task
+        await app.on_mount()
 
-                # Act: Defer task and send IPC notification
-                task.state = TaskState.DEFERRED
-                task.deferred_at = datetime.now(UTC)
-                repo.update_task(task)
+        # Verify initial state shows task
+        assert app._active_task is not None
+        assert app._active_task.description == "Task to change state"
 
-                notify_monitor(IPCEvent.TASK_DEFERRED, task.id)
+        # Act: Move task out of active state and send IPC notification
+        task.state = new_state
+        setattr(task, timestamp_field, FIXED_TS)
+        repo.update_task(task)
 
-                await asyncio.sleep(0.2)
+        notify_monitor(event, task.id)
 
-                # Assert: Monitor should show no active task
-                assert app._active_task is None
-                widget_content = str(app._task_widget.content)
-                assert "No active task" in widget_content
+        # Wait for IPC server to process
+        await wait_for_ipc(app)
 
-            finally:
-                await app.on_unmount()
+        # Assert: Monitor should show no active task
+        assert app._active_task is None
+        assert "No active task" in app._task_widget.content
+        assert app.title == "jot - No active task"
 
-    async def test_multiple_rapid_cli_commands_update_monitor_correctly(
-        self, temp_db, tmp_path: Path
-    ) -> None:
+    async def test_multiple_rapid_cli_commands_update_monitor_correctly(self, app, repo) -> None:
         """Test that rapid CLI commands update monitor display correctly."""
         # Arrange: Set up monitor
-        repo = TaskRepository()
-
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
-
-            await app.on_mount()
-
-            try:
-                # Act: Create, complete, create again (rapid sequence)
-                task1 = Task(
-                    id=str(uuid.uuid4()),
-                    description="First task",
-                    state=TaskState.ACTIVE,
-                    created_at=datetime.now(UTC),
-                    updated_at=datetime.now(UTC),
-                )
-                repo.create_task(task1)
-                notify_monitor(IPCEvent.TASK_CREATED, task1.id)
-                await asyncio.sleep(0.1)
-
-                # Complete task1
-                task1.state = TaskState.COMPLETED
-                task1.completed_at = datetime.now(UTC)
-                repo.update_task(task1)
-                notify_monitor(IPCEvent.TASK_COMPLETED, task1.id)
-                await asyncio.sleep(0.1)
-
-                # Create task2
-                task2 = Task(
-                    id=str(uuid.uuid4()),
-                    description="Second task",
-                    state=TaskState.ACTIVE,
-                    created_at=datetime.now(UTC),
-                    updated_at=datetime.now(UTC),
-                )
-                repo.create_task(task2)
-                notify_monitor(IPCEvent.TASK_CREATED, task2.id)
-                await asyncio.sleep(0.2)
-
-                # Assert: Monitor should show task2
-                assert app._active_task is not None
-                assert app._active_task.description == "Second task"
-                widget_content = str(app._task_widget.content)
-                assert "Second task" in widget_content
-
-            finally:
-                await app.on_unmount()
-
-    async def test_monitor_displays_fresh_data_on_each_ipc_event(
-        self, temp_db, tmp_path: Path
-    ) -> None:
+        await app.on_mount()
+
+        # Act: Create, complete, create again (rapid sequence)
+        task1 = make_task("First task")
+        repo.create_task(task1)
+        notify_monitor(IPCEvent.TASK_CREATED, task1.id)
+        await wait_for_ipc(app)
+
+        # Complete task1
+        task1.state = TaskState.COMPLETED
+        task1.completed_at = FIXED_TS
+        repo.update_task(task1)
+        notify_monitor(IPCEvent.TASK_COMPLETED, task1.id)
+        await wait_for_ipc(app)
+
+        # Create task2
+        task2 = make_task("Second task")
+        repo.create_task(task2)
+        notify_monitor(IPCEvent.TASK_CREATED, task2.id)
+        await wait_for_ipc(app)
+
+        # Assert: Monitor should show task2
+        assert app._active_task is not None
+        assert app._active_task.description == "Second task"
+        assert "Second task" in app._task_widget.content
+
+    async def test_monitor_displays_fresh_data_on_each_ipc_event(self, app, repo) -> None:
         """Test that monitor queries fresh data from database on each IPC event."""
         # Arrange: Create task and set up monitor
-        repo = TaskRepository()
-        task = Task(
-            id=str(uuid.uuid4()),
-            description="Original description",
-            state=TaskState.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
+        task = make_task("Original description")
         repo.create_task(task)
 
-        with (
-            patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-            patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-        ):
-            app = MonitorApp()
-            widgets = list(app.compose())
-            app._task_widget = widgets[0] if widgets else None
-
-            await app.on_mount()
-
-            try:
-                # Verify initial state
-                assert app._active_task is not None
-                assert app._active_task.description == "Original description"
+        await app.on_mount()
 
-                # Act: Update task description in database (simulating external change)
-                task.description = "Updated description"
-                repo.update_task(task)
+        # Verify initial state
+        assert app._active_task is not None
+        assert app._active_task.description == "Original description"
 
-                # Send IPC event (should query fresh data)
-                notify_monitor(IPCEvent.TASK_CREATED, task.id)
-                await asyncio.sleep(0.2)
+        # Act: Update task description in database (simulating external change)
+        task.description = "Updated description"
+        repo.update_task(task)
 
-                # Assert: Monitor should show updated description (fresh from DB)
-                assert app._active_task is not None
-                assert app._active_task.description == "Updated description"
-                widget_content = str(app._task_widget.content)
-                assert "Updated description" in widget_content
+        # Send IPC event (should query fresh data)
+        notify_monitor(IPCEvent.TASK_CREATED, task.id)
+        await wait_for_ipc(app)
 
-            finally:
-                await app.on_unmount()
+        # Assert: Monitor should show updated description (fresh from DB)
+        assert app._active_task is not None
+        assert app._active_task.description == "Updated description"
+        assert "Updated description" in app._task_widget.content
 
 
 @pytest.mark.skipif(not _HAS_AF_UNIX, reason="Unix domain sockets not available on this platform")
-@pytest.mark.asyncio
-async def test_monitor_handles_socket_removed_during_runtime(temp_db, tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_monitor_handles_socket_removed_during_runtime(app, repo, tmp_path: Path) -> None:
     """Test that monitor handles socket file removed during runtime (AC 4)."""
     # Arrange: Create task and set up monitor
-    repo = TaskRepository()
-    task = Task(
-        id=str(uuid.uuid4()),
-        description="Test runtime socket removal",
-        state=TaskState.ACTIVE,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-    )
+    task = make_task("Test runtime socket removal")
     repo.create_task(task)
 
-    with (
-        patch("jot.ipc.server.get_runtime_dir", return_value=tmp_path),
-        patch("jot.ipc.client.get_runtime_dir", return_value=tmp_path),
-    ):
-        app = MonitorApp()
-        widgets = list(app.compose())
-        app._task_widget = widgets[0] if widgets else None
-
-        await app.on_mount()
-
-        try:
-            # Verify IPC server started and socket exists
-            socket_path = tmp_path / "monitor.sock"
-            assert socket_path.exists()
+    await app.on_mount()
 
-            # Act: Remove socket file while monitor is running
-            socket_path.unlink()
+    # Verify IPC server started and socket exists; on_mount only returns once the
+    # server is listening, or with _ipc_server reset to None if startup failed
+    assert app._ipc_server is not None
+    socket_path = app._ipc_server.socket_path
+    assert socket_path == tmp_path / "monitor.sock"
+    assert socket_path.exists()
 
-            # Monitor should continue functioning even with socket removed
-            # Display should still work
-            assert app._active_task is not None
-            assert app._active_task.description == "Test runtime socket removal"
+    # Act: Remove socket file while monitor is running
+    socket_path.unlink()
 
-            # Try to send IPC message - should fail gracefully (no crash)
-            with contextlib.suppress(Exception):
-                notify_monitor(IPCEvent.TASK_COMPLETED, task.id)
-                # Expected to fail - socket is gone
+    # Monitor should continue functioning even with socket removed
+    # Display should still work
+    assert app._active_task is not None
+    assert app._active_task.description == "Test runtime socket removal"
 
-            # Monitor should still be functional
-            widget_content = str(app._task_widget.content)
-            assert "Test runtime socket removal" in widget_content
+    # Send IPC message with the socket gone - notify_monitor must not raise
+    notify_monitor(IPCEvent.TASK_COMPLETED, task.id)
 
-        finally:
-            await app.on_unmount()
+    # Monitor should still be functional
+    assert "Test runtime socket removal" in app._task_widget.content
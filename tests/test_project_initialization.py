@@ -8,20 +8,25 @@ Priority: P0 (Critical - Run on every commit)
 Test Level: Unit/Integration (project structure and configuration validation)
 """
 
+import os
 import sys
-from pathlib import Path
+import tomllib
+from typing import Any
 
+import pytest
 import typer
 import yaml
 from pydantic import BaseModel
 from rich import print as rich_print
 
-# Test data
-PROJECT_ROOT = Path(__file__).parent.parent
-SRC_DIR = PROJECT_ROOT / "src"
-JOT_PACKAGE_DIR = SRC_DIR / "jot"
-TESTS_DIR = PROJECT_ROOT / "tests"
-PYPROJECT_TOML = PROJECT_ROOT / "pyproject.toml"
+from tests._paths import JOT_PACKAGE_DIR, PYPROJECT_TOML, SRC_DIR, TESTS_DIR
+
+
+@pytest.fixture(scope="session")
+def pyproject() -> dict[str, Any]:
+    """Return pyproject.toml parsed with tomllib, loaded once per session."""
+    with open(PYPROJECT_TOML, "rb") as f:
+        return tomllib.load(f)
 
 
 class TestProjectStructure:
@@ -31,49 +36,44 @@ class TestProjectStructure:
         """GIVEN: Project is initialized
         WHEN: Checking for pyproject.toml
         THEN: File exists"""
-        assert PYPROJECT_TOML.exists(), "pyproject.toml must exist"
+        assert os.path.isfile(PYPROJECT_TOML), "pyproject.toml must exist"
 
     def test_src_directory_exists(self):
         """GIVEN: Project uses src layout
         WHEN: Checking for src/ directory
         THEN: Directory exists"""
-        assert SRC_DIR.exists(), "src/ directory must exist"
-        assert SRC_DIR.is_dir(), "src/ must be a directory"
+        # isdir implies existence, so one stat answers both questions
+        assert os.path.isdir(SRC_DIR), "src/ directory must exist"
 
     def test_jot_package_directory_exists(self):
         """GIVEN: Project package is named 'jot'
         WHEN: Checking for src/jot/ directory
         THEN: Directory exists"""
-        assert JOT_PACKAGE_DIR.exists(), "src/jot/ directory must exist"
-        assert JOT_PACKAGE_DIR.is_dir(), "src/jot/ must be a directory"
+        assert os.path.isdir(JOT_PACKAGE_DIR), "src/jot/ directory must exist"
 
     def test_jot_init_file_exists(self):
         """GIVEN: Package structure is correct
         WHEN: Checking for src/jot/__init__.py
         THEN: File exists"""
-        init_file = JOT_PACKAGE_DIR / "__init__.py"
-        assert init_file.exists(), "src/jot/__init__.py must exist"
+        assert os.path.isfile(JOT_PACKAGE_DIR / "__init__.py"), "src/jot/__init__.py must exist"
 
     def test_cli_module_exists(self):
         """GIVEN: CLI entry point is configured
         WHEN: Checking for src/jot/cli.py
         THEN: File exists"""
-        cli_file = JOT_PACKAGE_DIR / "cli.py"
-        assert cli_file.exists(), "src/jot/cli.py must exist"
+        assert os.path.isfile(JOT_PACKAGE_DIR / "cli.py"), "src/jot/cli.py must exist"
 
     def test_tests_directory_exists(self):
         """GIVEN: Test framework is configured
         WHEN: Checking for tests/ directory
         THEN: Directory exists"""
-        assert TESTS_DIR.exists(), "tests/ directory must exist"
-        assert TESTS_DIR.is_dir(), "tests/ must be a directory"
+        assert os.path.isdir(TESTS_DIR), "tests/ directory must exist"
 
     def test_conftest_exists(self):
         """GIVEN: Pytest is configured
         WHEN: Checking for tests/conftest.py
         THEN: File exists"""
-        conftest_file = TESTS_DIR / "conftest.py"
-        assert conftest_file.exists(), "tests/conftest.py must exist"
+        assert os.path.isfile(TESTS_DIR / "conftest.py"), "tests/conftest.py must exist"
 
 
 class TestPythonVersion:
@@ -131,87 +131,72 @@ class TestCLIEntryPoint:
 
         assert jot is not None
 
-    def test_cli_app_is_importable(self):
+    def test_cli_app_is_importable(self, cli_app):
         """GIVEN: CLI entry point is configured
         WHEN: Importing jot.cli.app
         THEN: Import succeeds"""
-        from jot.cli import app
-
-        assert app is not None
-        assert isinstance(app, typer.Typer), "app must be a Typer instance"
+        assert cli_app is not None
+        assert isinstance(cli_app, typer.Typer), "app must be a Typer instance"
 
-    def test_cli_has_help_command(self):
+    def test_cli_has_help_command(self, cli_app):
         """GIVEN: CLI is configured with commands
         WHEN: Checking app commands
         THEN: Help command exists"""
-        from jot.cli import app
-
         # Typer apps have commands accessible via app.registered_commands
-        assert hasattr(app, "registered_commands"), "Typer app must have registered commands"
+        assert hasattr(cli_app, "registered_commands"), "Typer app must have registered commands"
 
 
 class TestPyProjectConfiguration:
     """Verify pyproject.toml configuration is correct."""
 
-    def test_pyproject_toml_is_valid_toml(self):
+    def test_pyproject_toml_is_valid_toml(self, pyproject):
         """GIVEN: pyproject.toml exists
-        WHEN: Reading file content
+        WHEN: Parsing it with tomllib
         THEN: File is valid TOML (can be parsed)"""
-        import tomllib  # Python 3.13+ has tomllib built-in
-
-        with open(PYPROJECT_TOML, "rb") as f:
-            data = tomllib.load(f)
-            assert isinstance(data, dict), "TOML must parse to a dictionary"
-            assert "tool" in data, "TOML must contain 'tool' section"
+        assert isinstance(pyproject, dict), "TOML must parse to a dictionary"
+        assert "tool" in pyproject, "TOML must contain 'tool' section"
 
-    def test_pyproject_has_poetry_section(self):
+    def test_pyproject_has_poetry_section(self, pyproject):
         """GIVEN: pyproject.toml exists
-        WHEN: Reading file content
+        WHEN: Reading parsed configuration
         THEN: Contains [tool.poetry] section"""
-        with open(PYPROJECT_TOML, encoding="utf-8") as f:
-            content = f.read()
-            assert "[tool.poetry]" in content, "pyproject.toml must contain [tool.poetry] section"
+        assert "poetry" in pyproject["tool"], "pyproject.toml must contain [tool.poetry] section"
 
-    def test_pyproject_has_dependencies_section(self):
+    def test_pyproject_has_dependencies_section(self, pyproject):
         """GIVEN: Dependencies are configured
-        WHEN: Reading pyproject.toml
+        WHEN: Reading parsed configuration
         THEN: Contains [tool.poetry.dependencies] section"""
-        with open(PYPROJECT_TOML, encoding="utf-8") as f:
-            content = f.read()
-            assert (
-                "[tool.poetry.dependencies]" in content
-            ), "pyproject.toml must contain dependencies section"
+        assert (
+            "dependencies" in pyproject["tool"]["poetry"]
+        ), "pyproject.toml must contain dependencies section"
 
-    def test_pyproject_has_dev_dependencies_section(self):
+    def test_pyproject_has_dev_dependencies_section(self, pyproject):
         """GIVEN: Dev dependencies are configured
-        WHEN: Reading pyproject.toml
+        WHEN: Reading parsed configuration
         THEN: Contains [tool.poetry.group.dev.dependencies] section"""
-        with open(PYPROJECT_TOML, encoding="utf-8") as f:
-            content = f.read()
-            assert (
-                "[tool.poetry.group.dev.dependencies]" in content
-                or "[tool.poetry.dev-dependencies]" in content
-            ), "pyproject.toml must contain dev dependencies section"
-
-    def test_pyproject_has_scripts_section(self):
+        poetry = pyproject["tool"]["poetry"]
+        assert (
+            "dependencies" in poetry.get("group", {}).get("dev", {}) or "dev-dependencies" in poetry
+        ), "pyproject.toml must contain dev dependencies section"
+
+    def test_pyproject_has_scripts_section(self, pyproject):
         """GIVEN: CLI entry point is configured
-        WHEN: Reading pyproject.toml
+        WHEN: Reading parsed configuration
         THEN: Contains [tool.poetry.scripts] section"""
-        with open(PYPROJECT_TOML, encoding="utf-8") as f:
-            content = f.read()
-            assert "[tool.poetry.scripts]" in content, "pyproject.toml must contain scripts section"
+        assert (
+            "scripts" in pyproject["tool"]["poetry"]
+        ), "pyproject.toml must contain scripts section"
 
-    def test_pyproject_has_jot_entry_point(self):
+    def test_pyproject_has_jot_entry_point(self, pyproject):
         """GIVEN: CLI entry point is configured
-        WHEN: Reading pyproject.toml scripts section
+        WHEN: Reading parsed scripts section
         THEN: Contains jot entry point"""
-        with open(PYPROJECT_TOML, encoding="utf-8") as f:
-            content = f.read()
-            # Check for either jot.cli:app or jot.cli:main (both are valid entry points)
-            has_entry_point = 'jot = "jot.cli:' in content or "jot = 'jot.cli:" in content
-            assert (
-                has_entry_point
-            ), "pyproject.toml must contain jot entry point (jot.cli:app or jot.cli:main)"
+        # Either jot.cli:app or jot.cli:main is a valid entry point
+        entry_point = pyproject["tool"]["poetry"].get("scripts", {}).get("jot", "")
+        assert entry_point in (
+            "jot.cli:app",
+            "jot.cli:main",
+        ), "pyproject.toml must contain jot entry point (jot.cli:app or jot.cli:main)"
 
 
 class TestPackageVersion: